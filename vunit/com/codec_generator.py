@@ -13,6 +13,31 @@ from vunit.ostools import read_file, write_file
 from vunit.com.codec_vhdl_package import CodecVHDLPackage
 
 
+_CODEC_PACKAGE_TEMPLATE = Template(
+    """\
+library vunit_lib;
+use vunit_lib.string_ops.all;
+context vunit_lib.com_context;
+use vunit_lib.queue_pkg.all;
+use vunit_lib.queue_2008p_pkg.all;
+
+use std.textio.all;
+
+use work.$package_name.all;
+
+$use_clauses
+package $codec_package_name is
+$declarations
+end package $codec_package_name;
+
+package body $codec_package_name is
+$definitions
+end package body $codec_package_name;
+
+"""
+)
+
+
 def generate_codecs(
     input_package_design_unit,
     codec_package_name,  # pylint: disable=too-many-arguments
@@ -36,44 +61,25 @@ def generate_codecs(
     declarations, definitions = package.generate_codecs_and_support_functions()
 
     # Create extra use clauses
-    use_clauses = ""
+    used_packages = used_packages if used_packages is not None else []
+
     libraries = []
-    for used_package in used_packages if used_packages is not None else []:
+    for used_package in used_packages:
         if "." in used_package:
-            if used_package.split(".")[0] not in libraries:
-                libraries.append(used_package.split(".")[0])
-            use_clauses += "use %s.all;\n" % used_package
+            library_name = used_package.split(".")[0]
+            if library_name not in libraries:
+                libraries.append(library_name)
+
+    use_clause_list = ["library %s;\n" % library_name for library_name in libraries]
+    for used_package in used_packages:
+        if "." in used_package:
+            use_clause_list.append("use %s.all;\n" % used_package)
         else:
-            use_clauses += "use work.%s.all;\n" % used_package
-    if libraries:
-        use_clauses = "library " + ";\nlibrary ".join(libraries) + ";\n" + use_clauses
+            use_clause_list.append("use work.%s.all;\n" % used_package)
+    use_clauses = "".join(use_clause_list)
 
     # Assemble everything and write to output file
-    codec_package_template = Template(
-        """\
-library vunit_lib;
-use vunit_lib.string_ops.all;
-context vunit_lib.com_context;
-use vunit_lib.queue_pkg.all;
-use vunit_lib.queue_2008p_pkg.all;
-
-use std.textio.all;
-
-use work.$package_name.all;
-
-$use_clauses
-package $codec_package_name is
-$declarations
-end package $codec_package_name;
-
-package body $codec_package_name is
-$definitions
-end package body $codec_package_name;
-
-"""
-    )
-
-    codec_package = codec_package_template.substitute(
+    codec_package = _CODEC_PACKAGE_TEMPLATE.substitute(
         declarations=declarations,
         definitions=definitions,
         package_name=package.identifier,